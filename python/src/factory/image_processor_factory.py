@@ -1,21 +1,40 @@
-from python.src.processors.dual_page_cropper import DualPageCropper
+import importlib
+
 from python.src.processors.image_processor import ImageProcessor
-from python.src.processors.image_rotator import ImageRotator
-from python.src.processors.threshold_filter import ThresholdFilter
 
 
 class ImageProcessorFactory:
+    # Modules defining the built-in processor types, imported on first use
+    _MODULES = {
+        "ImageRotator": "python.src.processors.image_rotator",
+        "AutoPageCropper": "python.src.processors.dual_page_cropper",
+        "ThresholdFilter": "python.src.processors.threshold_filter",
+    }
+
+    # Populated by @ImageProcessorFactory.register as processor modules load
+    _PROCESSORS = {}
+
+    @staticmethod
+    def register(processor_type: str):
+        def decorator(processor_class):
+            ImageProcessorFactory._PROCESSORS[processor_type] = processor_class
+            return processor_class
+
+        return decorator
+
     @staticmethod
     def create_processor(config) -> ImageProcessor:
         processor_type = config.get("type")
 
-        if processor_type == "ImageRotator":
-            return ImageRotator(config)
+        if (
+            processor_type not in ImageProcessorFactory._PROCESSORS
+            and processor_type in ImageProcessorFactory._MODULES
+        ):
+            importlib.import_module(ImageProcessorFactory._MODULES[processor_type])
 
-        if processor_type == "AutoPageCropper":
-            return DualPageCropper(config)
+        processor_class = ImageProcessorFactory._PROCESSORS.get(processor_type)
 
-        if processor_type == "ThresholdFilter":
-            return ThresholdFilter(config)
+        if processor_class is None:
+            raise ValueError("Processor invalid")
 
-        raise ValueError("Processor invalid")
+        return processor_class(config)
@@ -0,0 +1,6 @@
+import logging
+
+
+def configure_logging():
+    """Configure logging for the main process and each worker process."""
+    logging.basicConfig(level=logging.INFO)
@@ -1,24 +1,28 @@
+import logging
+import os
 import sys
-import traceback
 from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 
 import yaml
 
+from python.src.logging_config import configure_logging
 from python.src.processors.book_processor import BookProcessor
 
+logger = logging.getLogger(__name__)
+
 
 def process_book(book_config, config_data):
     """Process a single book."""
-    print(f"Processing book: {book_config['name']}")
+    logger.info("Processing book: %s", book_config["name"])
     book_processor = BookProcessor(
         book_config, config_data.get("input_dir"), config_data.get("output_dir")
     )
 
     try:
         book_processor.process_book()
-    except Exception as exception:
-        print(exception)
-        print(traceback.format_exc())
+    except Exception:
+        logger.exception("Failed to process book %s", book_config["name"])
 
 
 def main():
@@ -26,14 +30,31 @@ def main():
         print("Usage: python main.py <config_file>")
         return
 
+    configure_logging()
+
     config_file = sys.argv[1]
 
     with open(config_file, "r", encoding="utf-8") as config_stream:
         config_data = yaml.safe_load(config_stream)
 
-    with ProcessPoolExecutor() as executor:
-        for book_config in config_data.get("books", []):
-            executor.submit(process_book, book_config, config_data)
+    book_configs = config_data.get("books") or []
+    if not book_configs:
+        return
+
+    # max_workers only sizes the book pool; each book still opens its own
+    # page pool with the default cpu_count() workers
+    max_workers = config_data.get("max_workers") or min(
+        os.cpu_count() or 1, len(book_configs)
+    )
+    chunksize = max(1, len(book_configs) // (max_workers * 4))
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers, initializer=configure_logging
+    ) as executor:
+        for _ in executor.map(
+            process_book, book_configs, repeat(config_data), chunksize=chunksize
+        ):
+            pass
 
 
 if __name__ == "__main__":
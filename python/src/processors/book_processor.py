@@ -1,10 +1,19 @@
+import logging
 import os
-import traceback
 from concurrent.futures import ProcessPoolExecutor
 
+from PIL import Image
+
 from python.src.factory.image_processor_factory import ImageProcessorFactory
+from python.src.logging_config import configure_logging
 from python.src.processors.pipeline.image_pipeline import ImagePipeline
 
+logger = logging.getLogger(__name__)
+
+# Pipelines built in this process, keyed by book name. Processors hold no
+# per-image state, so each worker can reuse one pipeline for every page.
+_PIPELINES = {}
+
 
 class BookProcessor:
     def __init__(self, book_config, input_dir, output_dir):
@@ -21,24 +30,48 @@ class BookProcessor:
 
         return ImagePipeline(processors, self.input_book_dir, self.output_book_dir)
 
+    def _get_pipeline(self) -> ImagePipeline:
+        pipeline = _PIPELINES.get(self.book_name)
+        if pipeline is None:
+            pipeline = self._create_pipeline()
+            _PIPELINES[self.book_name] = pipeline
+
+        return pipeline
+
     def _process_single_image(self, filename: str, is_left: bool) -> None:
         try:
-            pipeline = self._create_pipeline()
+            pipeline = self._get_pipeline()
             pipeline.process_and_save_image(filename, is_left)
-        except Exception as exception:
-            print(exception)
-            print(traceback.format_exc())
+        except Exception:
+            logger.exception("Failed to process %s", filename)
 
     def process_book(self):
         """Process a single book based on the provided configuration."""
 
-        filename_li = sorted(os.listdir(self.input_book_dir))
-        filename_li = [
-            f for f in filename_li if not os.path.basename(f).startswith(".")
-        ]
+        # Every extension Pillow can open; files without one are left for
+        # Image.open to decide
+        image_extensions = Image.registered_extensions()
+
+        filename_li = []
+        with os.scandir(self.input_book_dir) as entries:
+            for entry in entries:
+                if not entry.is_file() or entry.name.startswith("."):
+                    continue
+
+                extension = os.path.splitext(entry.name)[1].lower()
+                if extension and extension not in image_extensions:
+                    logger.info("Skipping non-image file: %s", entry.name)
+                    continue
+
+                filename_li.append(entry.name)
+
+        # Sorted so pages alternate left/right in reading order
+        filename_li.sort()
+
+        os.makedirs(self.output_book_dir, exist_ok=True)
 
         is_left = True
-        with ProcessPoolExecutor() as executor:
+        with ProcessPoolExecutor(initializer=configure_logging) as executor:
             for filename in filename_li:
                 executor.submit(self._process_single_image, filename, is_left)
                 is_left = not is_left
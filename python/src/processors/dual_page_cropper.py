@@ -1,9 +1,10 @@
-import numpy as np
 from PIL import Image
 
+from python.src.factory.image_processor_factory import ImageProcessorFactory
 from python.src.processors.image_processor import ImageProcessor
 
 
+@ImageProcessorFactory.register("AutoPageCropper")
 class DualPageCropper(ImageProcessor):
     def __init__(self, config):
         self.left = config.get("left")
@@ -11,8 +12,6 @@ class DualPageCropper(ImageProcessor):
         self.image_size = config.get("image_size")
 
     def process(self, img: Image, is_left: bool) -> Image:
-        img_array = np.array(img)
-
         # Toggle between left and right for the next process
         curr_page = self.left if is_left else self.right
 
@@ -21,10 +20,8 @@ class DualPageCropper(ImageProcessor):
         width = self.image_size.get("width")
         height = self.image_size.get("height")
 
-        # Crop using numpy array slicing
-        cropped_array = img_array[y_start : y_start + height, x_start : x_start + width]
-
-        # Convert back to PIL Image
-        cropped_img = Image.fromarray(cropped_array)
+        # Clamp to the image bounds so oversized crops are clipped, not padded
+        x_end = min(x_start + width, img.width)
+        y_end = min(y_start + height, img.height)
 
-        return cropped_img
+        return img.crop((x_start, y_start, x_end, y_end))
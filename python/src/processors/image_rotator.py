@@ -1,7 +1,9 @@
 from PIL import Image
+from python.src.factory.image_processor_factory import ImageProcessorFactory
 from python.src.processors.image_processor import ImageProcessor
 
 
+@ImageProcessorFactory.register("ImageRotator")
 class ImageRotator(ImageProcessor):
     def __init__(self, config):
         self.left = config.get("left")
@@ -1,3 +1,4 @@
+import logging
 import os.path
 from typing import List
 
@@ -5,6 +6,8 @@ from PIL import Image, UnidentifiedImageError
 
 from python.src.processors.image_processor import ImageProcessor
 
+logger = logging.getLogger(__name__)
+
 
 class ImagePipeline:
     def __init__(self, processors: List[ImageProcessor], input_dir, output_dir):
@@ -25,10 +28,7 @@ class ImagePipeline:
                     if img is None:
                         return
 
-                if not os.path.exists(self.output_dir):
-                    os.mkdir(self.output_dir)
-
                 img.save(save_path)
 
         except UnidentifiedImageError as error:
-            print(error)
+            logger.warning("Skipping unreadable image %s: %s", image_path, error)
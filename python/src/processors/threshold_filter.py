@@ -4,9 +4,11 @@ import cv2
 import numpy as np
 from PIL import Image
 
+from python.src.factory.image_processor_factory import ImageProcessorFactory
 from python.src.processors.image_processor import ImageProcessor
 
 
+@ImageProcessorFactory.register("ThresholdFilter")
 class ThresholdFilter(ImageProcessor):
     def __init__(self, config):
         self.min_thresh = config.get("min_thresh")
@@ -14,8 +16,7 @@ class ThresholdFilter(ImageProcessor):
         self.save_path = config.get("save_path", None)
 
     def process(self, img: Image, is_left: bool) -> Image:
-        img_cv2 = cv2.cvtColor(np.array(img), cv2.COLOR_RGB2BGR)
-        img_gray = cv2.cvtColor(img_cv2, cv2.COLOR_BGR2GRAY)
+        img_gray = np.asarray(img.convert("L"))
         average_threshold = int(cv2.mean(img_gray)[0])
         if self.min_thresh <= average_threshold <= self.max_thresh:
             return img
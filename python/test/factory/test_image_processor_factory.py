@@ -1,8 +1,14 @@
+import importlib
+import sys
 import unittest
+from unittest import mock
 
+from python.src import processors
 from python.src.factory.image_processor_factory import ImageProcessorFactory
 from python.src.processors.dual_page_cropper import DualPageCropper
+from python.src.processors.image_processor import ImageProcessor
 from python.src.processors.image_rotator import ImageRotator
+from python.src.processors.threshold_filter import ThresholdFilter
 
 
 class TestImageProcessorFactory(unittest.TestCase):
@@ -33,6 +39,57 @@ class TestImageProcessorFactory(unittest.TestCase):
         self.assertEqual(processor.left, config.get("left"))
         self.assertEqual(processor.right, config.get("right"))
 
+    def test_create_threshold_filter(self):
+        config = {"type": "ThresholdFilter", "min_thresh": 100, "max_thresh": 200}
+
+        processor = ImageProcessorFactory.create_processor(config)
+
+        self.assertIsInstance(processor, ThresholdFilter)
+        self.assertEqual(processor.min_thresh, 100)
+        self.assertEqual(processor.max_thresh, 200)
+
+    def test_register_custom_processor(self):
+        @ImageProcessorFactory.register("CustomProcessor")
+        class CustomProcessor(ImageProcessor):
+            def __init__(self, config):
+                self.config = config
+
+        self.addCleanup(ImageProcessorFactory._PROCESSORS.pop, "CustomProcessor")
+        config = {"type": "CustomProcessor"}
+
+        processor = ImageProcessorFactory.create_processor(config)
+
+        self.assertIsInstance(processor, CustomProcessor)
+        self.assertEqual(processor.config, config)
+
+    def test_create_processor_imports_module_on_first_use(self):
+        module_name = ImageProcessorFactory._MODULES["ThresholdFilter"]
+        config = {"type": "ThresholdFilter", "min_thresh": 100, "max_thresh": 200}
+
+        # Restore the registry, sys.modules and the package attribute the
+        # re-import rebinds, so later imports see the original module
+        with mock.patch.dict(
+            ImageProcessorFactory._PROCESSORS, clear=True
+        ), mock.patch.dict(sys.modules), mock.patch.object(
+            processors, "threshold_filter"
+        ):
+            del sys.modules[module_name]
+
+            processor = ImageProcessorFactory.create_processor(config)
+
+            self.assertIn(module_name, sys.modules)
+            self.assertIsInstance(processor, sys.modules[module_name].ThresholdFilter)
+
+    def test_modules_register_under_their_type(self):
+        for processor_type, module_name in ImageProcessorFactory._MODULES.items():
+            with self.subTest(processor_type=processor_type):
+                importlib.import_module(module_name)
+
+                processor_class = ImageProcessorFactory._PROCESSORS.get(processor_type)
+
+                self.assertIsNotNone(processor_class)
+                self.assertEqual(processor_class.__module__, module_name)
+
     def test_unknown_processor_type(self):
         config = {"type": "UnknownType"}
 
@@ -3,6 +3,7 @@ from unittest.mock import MagicMock, patch
 from python.src.processors.image_processor import ImageProcessor
 from PIL import Image, UnidentifiedImageError
 
+from python.src.processors.pipeline import image_pipeline
 from python.src.processors.pipeline.image_pipeline import ImagePipeline
 
 
@@ -17,9 +18,7 @@ class TestImagePipeline(unittest.TestCase):
         self.save_dir = "/path/to/save_dir"
 
     @patch("PIL.Image.open")
-    @patch("os.path.exists", return_value=False)
-    @patch("os.mkdir")
-    def test_process_and_save_image(self, mock_mkdir, mock_exists, mock_open):
+    def test_process_and_save_image(self, mock_open):
         mock_open.return_value.__enter__.return_value = self.test_image
         pipeline = ImagePipeline([self.mock_processor], self.input_dir, self.save_dir)
 
@@ -30,23 +29,24 @@ class TestImagePipeline(unittest.TestCase):
         self.test_image.save.assert_called_with(
             f"{self.save_dir}/{self.mock_img_filename}"
         )
-        mock_mkdir.assert_called_once_with(self.save_dir)
 
     @patch("PIL.Image.open")
     def test_unidentified_image_error(self, mock_open):
-        mock_open.side_effect = UnidentifiedImageError
+        mock_open.side_effect = UnidentifiedImageError("cannot identify %s")
         pipeline = ImagePipeline([self.mock_processor], self.input_dir, self.save_dir)
 
-        pipeline.process_and_save_image(self.mock_img_filename, True)
+        with self.assertLogs(image_pipeline.logger, level="WARNING") as logs:
+            pipeline.process_and_save_image(self.mock_img_filename, True)
 
         self.mock_processor.process.assert_not_called()
+        self.assertIn(
+            f"Skipping unreadable image {self.input_dir}/{self.mock_img_filename}: "
+            "cannot identify %s",
+            logs.output[0],
+        )
 
     @patch("PIL.Image.open")
-    @patch("os.path.exists", return_value=False)
-    @patch("os.mkdir")
-    def test_process_and_save_none_image_does_not_save(
-        self, mock_mkdir, mock_exists, mock_open
-    ):
+    def test_process_and_save_none_image_does_not_save(self, mock_open):
         mock_open.return_value.__enter__.return_value = self.test_image
         self.mock_processor.process.return_value = None
         pipeline = ImagePipeline([self.mock_processor], self.input_dir, self.save_dir)
@@ -1,7 +1,20 @@
 from concurrent.futures import ProcessPoolExecutor
 from unittest import TestCase, mock
 
+from python.src.processors import book_processor
 from python.src.processors.book_processor import BookProcessor
+from python.src.processors.pipeline.image_pipeline import ImagePipeline
+
+
+def mock_dir_entries(mock_scandir, filenames):
+    entries = []
+    for filename in filenames:
+        entry = mock.MagicMock()
+        entry.name = filename
+        entry.is_file.return_value = True
+        entries.append(entry)
+
+    mock_scandir.return_value.__enter__.return_value = entries
 
 
 class TestBookProcessor(TestCase):
@@ -11,11 +24,13 @@ class TestBookProcessor(TestCase):
             "processors": [{"type": "ImageRotator"}],
         }
         self.processor = BookProcessor(book_config, "", "")
+        book_processor._PIPELINES.clear()
 
-    @mock.patch("os.listdir")
+    @mock.patch("os.makedirs")
+    @mock.patch("os.scandir")
     @mock.patch.object(ProcessPoolExecutor, "submit")
-    def test_process(self, mock_submit, mock_listdir):
-        mock_listdir.return_value = ["image1.jpg", "image2.jpg"]
+    def test_process(self, mock_submit, mock_scandir, mock_makedirs):
+        mock_dir_entries(mock_scandir, ["image2.jpg", "image1.jpg"])
 
         # When
         self.processor.process_book()
@@ -32,3 +47,75 @@ class TestBookProcessor(TestCase):
 
         mock_submit.assert_has_calls(expected_calls)
         self.assertEqual(mock_submit.call_count, 2)
+        mock_makedirs.assert_called_once_with("/path/to/images", exist_ok=True)
+
+    @mock.patch("os.makedirs")
+    @mock.patch("os.scandir")
+    @mock.patch.object(ProcessPoolExecutor, "submit")
+    def test_process_skips_non_image_files(
+        self, mock_submit, mock_scandir, mock_makedirs
+    ):
+        mock_dir_entries(
+            mock_scandir, [".DS_Store", "image1.JPG", "notes.txt", "image2.jp2"]
+        )
+
+        # When
+        with self.assertLogs(book_processor.logger, level="INFO") as logs:
+            self.processor.process_book()
+
+        # Then
+        self.assertEqual(
+            logs.output,
+            [f"INFO:{book_processor.__name__}:Skipping non-image file: notes.txt"],
+        )
+        expected_calls = [
+            mock.call(self.processor._process_single_image, "image1.JPG", True),
+            mock.call(self.processor._process_single_image, "image2.jp2", False),
+        ]
+
+        mock_submit.assert_has_calls(expected_calls)
+        self.assertEqual(mock_submit.call_count, 2)
+
+    @mock.patch.object(ImagePipeline, "process_and_save_image")
+    def test_pipeline_reused_across_images(self, mock_process_and_save):
+        with mock.patch.object(
+            self.processor, "_create_pipeline", wraps=self.processor._create_pipeline
+        ) as mock_create:
+            self.processor._process_single_image("image1.jpg", True)
+            self.processor._process_single_image("image2.jpg", False)
+
+        mock_create.assert_called_once()
+        mock_process_and_save.assert_has_calls(
+            [mock.call("image1.jpg", True), mock.call("image2.jpg", False)]
+        )
+
+    @mock.patch.object(ImagePipeline, "process_and_save_image")
+    def test_failed_image_logged_with_filename(self, mock_process_and_save):
+        mock_process_and_save.side_effect = OSError("disk full")
+
+        with self.assertLogs(book_processor.logger, level="ERROR") as logs:
+            self.processor._process_single_image("image1.jpg", True)
+
+        self.assertIn("Failed to process image1.jpg", logs.output[0])
+        self.assertIn("OSError: disk full", logs.output[0])
+
+    @mock.patch("os.makedirs")
+    @mock.patch("os.scandir")
+    @mock.patch.object(ProcessPoolExecutor, "submit")
+    def test_process_submits_all_pillow_formats(
+        self, mock_submit, mock_scandir, mock_makedirs
+    ):
+        mock_dir_entries(mock_scandir, ["page1.ppm", "page2.jpc", "page3"])
+
+        # When
+        self.processor.process_book()
+
+        # Then
+        expected_calls = [
+            mock.call(self.processor._process_single_image, "page1.ppm", True),
+            mock.call(self.processor._process_single_image, "page2.jpc", False),
+            mock.call(self.processor._process_single_image, "page3", True),
+        ]
+
+        mock_submit.assert_has_calls(expected_calls)
+        self.assertEqual(mock_submit.call_count, 3)
@@ -54,6 +54,17 @@ class TestDualPageCropper(TestCase):
             cropped_left_again.getpixel((40, 100)), (0, 0, 255)
         )  # Check for blue pixel again
 
+    def test_crop_clipped_to_image_bounds(self):
+        config = {
+            "left": {"x_start": 0, "y_start": 0},
+            "right": {"x_start": 150, "y_start": 100},
+            "image_size": {"width": 100, "height": 200},
+        }
+
+        cropper = DualPageCropper(config)
+        cropped_right = cropper.process(self.img, False)
+        self.assertEqual(cropped_right.size, (50, 100))
+
 
 if __name__ == "__main__":
     unittest.main()
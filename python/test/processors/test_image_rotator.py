@@ -42,3 +42,13 @@ class TestImageRotator(TestCase):
 
         # Compare properties of the resulting image and the expected image
         self.assertTrue(result == expected_img)
+
+    def test_process_arbitrary_angle(self):
+        img = create_initial_image()
+        image_rotator = ImageRotator({"left": {"angle": 45}, "right": {}})
+
+        expected_img = img.rotate(45, resample=Image.Resampling.BICUBIC, expand=True)
+
+        result = image_rotator.process(img, True)
+
+        self.assertTrue(result == expected_img)
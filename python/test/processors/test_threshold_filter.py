@@ -45,6 +45,15 @@ class TestThresholdFilter(unittest.TestCase):
         self.assertIsNone(result)
         self.test_image.save.assert_called_with(self.config["save_path"])
 
+    def test_process_grayscale_input(self):
+        config = {"min_thresh": 200, "max_thresh": 255}
+        threshold_filter = ThresholdFilter(config)
+        img = Image.new("L", (10, 10), 250)
+
+        result = threshold_filter.process(img, True)
+
+        self.assertIs(result, img)
+
 
 if __name__ == "__main__":
     unittest.main()
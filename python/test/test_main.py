@@ -0,0 +1,102 @@
+from itertools import repeat
+from unittest import TestCase, mock
+
+from python.src import main as main_module
+
+
+@mock.patch("python.src.main.configure_logging")
+@mock.patch("python.src.main.ProcessPoolExecutor")
+@mock.patch("python.src.main.yaml.safe_load")
+@mock.patch("builtins.open", new_callable=mock.mock_open)
+@mock.patch("sys.argv", ["main.py", "config.yml"])
+class TestMain(TestCase):
+    def test_main_uses_configured_max_workers(
+        self, mock_open, mock_safe_load, mock_executor_class, mock_configure_logging
+    ):
+        book_configs = [{"name": f"book{i}"} for i in range(40)]
+        config_data = {"max_workers": 2, "books": book_configs}
+        mock_safe_load.return_value = config_data
+        executor = mock_executor_class.return_value.__enter__.return_value
+
+        main_module.main()
+
+        mock_configure_logging.assert_called_once()
+        mock_open.assert_called_once_with("config.yml", "r", encoding="utf-8")
+        mock_executor_class.assert_called_once_with(
+            max_workers=2, initializer=mock_configure_logging
+        )
+        executor.map.assert_called_once_with(
+            main_module.process_book, book_configs, mock.ANY, chunksize=5
+        )
+        repeated_config = executor.map.call_args.args[2]
+        self.assertIsInstance(repeated_config, repeat)
+        self.assertIs(next(repeated_config), config_data)
+
+    @mock.patch("os.cpu_count", return_value=8)
+    def test_main_defaults_max_workers_to_book_count(
+        self,
+        mock_cpu_count,
+        mock_open,
+        mock_safe_load,
+        mock_executor_class,
+        mock_configure_logging,
+    ):
+        mock_safe_load.return_value = {"books": [{"name": "a"}, {"name": "b"}]}
+        executor = mock_executor_class.return_value.__enter__.return_value
+
+        main_module.main()
+
+        mock_executor_class.assert_called_once_with(
+            max_workers=2, initializer=mock_configure_logging
+        )
+        self.assertEqual(executor.map.call_args.kwargs["chunksize"], 1)
+
+    @mock.patch("os.cpu_count", return_value=None)
+    def test_main_unknown_cpu_count_uses_one_worker(
+        self,
+        mock_cpu_count,
+        mock_open,
+        mock_safe_load,
+        mock_executor_class,
+        mock_configure_logging,
+    ):
+        mock_safe_load.return_value = {"books": [{"name": "a"}, {"name": "b"}]}
+
+        main_module.main()
+
+        mock_executor_class.assert_called_once_with(
+            max_workers=1, initializer=mock_configure_logging
+        )
+
+    def test_main_without_books_does_not_start_pool(
+        self, mock_open, mock_safe_load, mock_executor_class, mock_configure_logging
+    ):
+        for books in (None, []):
+            with self.subTest(books=books):
+                mock_safe_load.return_value = {"books": books}
+
+                main_module.main()
+
+                mock_executor_class.assert_not_called()
+
+    def test_main_usage_without_config_file(
+        self, mock_open, mock_safe_load, mock_executor_class, mock_configure_logging
+    ):
+        with mock.patch("sys.argv", ["main.py"]):
+            main_module.main()
+
+        mock_open.assert_not_called()
+        mock_executor_class.assert_not_called()
+
+
+class TestProcessBook(TestCase):
+    @mock.patch("python.src.main.BookProcessor")
+    def test_process_book_logs_failure_with_book_name(self, mock_book_processor):
+        mock_book_processor.return_value.process_book.side_effect = OSError("boom")
+        config_data = {"input_dir": "/in", "output_dir": "/out"}
+
+        with self.assertLogs(main_module.logger, level="ERROR") as logs:
+            main_module.process_book({"name": "book1"}, config_data)
+
+        mock_book_processor.assert_called_once_with({"name": "book1"}, "/in", "/out")
+        self.assertIn("Failed to process book book1", logs.output[0])